@@ -13,17 +13,48 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from fastapi import WebSocket, WebSocketDisconnect, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional, Dict
-from pydantic import BaseModel, Field, ValidationError, validator
+from contextlib import asynccontextmanager
+from typing import List, Dict, NamedTuple, Optional, Tuple, Union
+from pydantic import BaseModel, Field, ValidationError
 import logging
-import pandas as pd
+import csv
+import math
 import os
 import httpx
+import asyncio
 import datetime
-import json
+import functools
+import orjson
 
 AUTHORIZED_USER_ID = int(os.environ.get('DISCORD_USER_ID', '0'))
-app = FastAPI()
+
+DISCORD_API_BASE = 'https://discord.com/api/v10'
+DISCORD_USER_CHANNELS_PATH = '/users/@me/channels'
+DISCORD_CHANNEL_MESSAGES_PATH = '/channels/{channel_id}/messages'
+DISCORD_AUTH_HEADER = {'Authorization': f'Bot {os.environ["DISCORD_BOT_TOKEN"]}'}
+DISCORD_MAX_MESSAGE_LENGTH = 2000
+# Cap on Discord posts in flight at once; this is not a rate limit, 429s are retried instead
+DISCORD_MAX_CONCURRENCY = 5
+# How many times a post that Discord rate-limited (429) is retried after waiting retry_after
+DISCORD_RATE_LIMIT_RETRIES = 3
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Hold one Discord HTTP client for the app's lifetime so connections are reused across requests."""
+    async with httpx.AsyncClient(
+        base_url=DISCORD_API_BASE,
+        http2=True,
+        # Keep idle connections to Discord open well past httpx's 5s default
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300.0),
+        timeout=httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=5.0),
+        headers=DISCORD_AUTH_HEADER
+    ) as client:
+        app.state.http = client
+        app.state.discord_sem = asyncio.Semaphore(DISCORD_MAX_CONCURRENCY)
+        app.state.tasks_lock = asyncio.Lock()
+        yield
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -36,85 +67,287 @@ app.add_middleware(
 # Models
 class Message(BaseModel):
     text: str = Field(..., max_length=120)
-    count: Optional[int] = 1
-    
-    @validator('count')
-    def count_in_range(cls, v):
-        if not 1 <= v <= 9:
-            raise ValueError('count must be between 1 and 9')
-        return v
+    count: int = Field(1, ge=1, le=9)
 
 class StatusPayload(BaseModel):
     user_id: int
     
 class SignalPayload(BaseModel):
     user_id: int
-    messages: List[Message]
-    
-    @validator('messages')
-    def messages_length(cls, v):
-        if not len(v) <= 2:
-            raise ValueError('You must provide 1 or 2 messages')
-        return v
+    messages: List[Message] = Field(..., max_length=2)
 
 class Task(BaseModel):
     dates: Dict[str, int]
-    taskCount: int
-    time: int
-    
-    def __getitem__(self, item):
-        return getattr(self, item)
+    taskCount: int = Field(..., gt=0)
+    time: int = Field(..., gt=0)
     
 class TaskPayload(BaseModel):
     user_id: int
     tasks: Dict[str, Task]
-    
-    @validator('tasks')
-    def tasks_values(cls, v):
-        for task_name, task_info in v.items():
-            if task_info.taskCount <= 0 or task_info.time <= 0:
-                raise ValueError('Task count and time must be positive')
-        return v
 
-DISCORD_API_BASE = 'https://discord.com/api/v10'
+# user_id -> DM channel id; Discord always returns the same channel for a recipient
+dm_channel_cache: Dict[int, str] = {}
+
+TASKS_CSV = 'tasks.csv'
+TASKS_COLUMNS = ['Task Name', 'RPH', 'default_rate']
+# (st_mtime_ns, fieldnames, rows, tasks) for the last tasks.csv read or write
+tasks_cache = None
 
-def is_user_authorized(user_id: int) -> bool:
-    return user_id == AUTHORIZED_USER_ID
+def is_unauthorized_payload(payload) -> bool:
+    """Cheaply spot a raw payload whose user_id is certainly not the authorized user.
+
+    Only ints and int strings are judged here, before the full model is validated.
+    Anything else is left to validation and the check on the validated user_id,
+    as in status and login.
+    """
+    user_id = payload.get('user_id') if isinstance(payload, dict) else None
+    if isinstance(user_id, str):
+        try:
+            user_id = int(user_id)
+        except ValueError:
+            return False
+    return isinstance(user_id, int) and user_id != AUTHORIZED_USER_ID
 
-def format_seconds(seconds):
+def format_seconds(seconds: int) -> str:
     """Convert seconds into 'X hour(s) Y minute(s)' format."""
     hours = seconds // 3600
     minutes = (seconds % 3600) // 60
     return f'{hours} hour(s) {minutes} minute(s)'
 
-def load_or_create_tasks_df():
-    """Load the tasks CSV or create a new DataFrame with proper columns."""
+TASK_REPORT_TEMPLATE = (
+    '🔧 Task: **{name}**, Dates: {dates}, '
+    'Tasks completed: {count}, Fixed RPH: {rph:.2f} seconds, '
+    'Task rate: ${rate:.3f},\n'
+    '⏰ Total time for this task: {time},\n'
+    '💰 Estimated Payout: ${payout:.2f}.\n\n'
+)
+RATE_TOTAL_TEMPLATE = '📝 Total tasks completed at ${rate:.3f}: **{count}**\n'
+REPORT_TOTALS_TEMPLATE = (
+    '📝 Total tasks completed: **{count}**\n'
+    '⏱️ Total time spent: **{time}**.\n'
+    '💰 Estimated total payout: **${payout:.2f}**.\n'
+)
+
+MONTH_ABBREVIATIONS = ('', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+def format_date(d: datetime.date) -> str:
+    """Format a date as 'DD Mon YYYY' without going through strftime."""
+    return f'{d.day:02d} {MONTH_ABBREVIATIONS[d.month]} {d.year}'
+
+@functools.lru_cache(maxsize=4096)
+def format_date_key(date_key: str) -> str:
+    """Format a YYYY-MM-DD key as 'DD Mon YYYY', parsing each distinct key only once."""
+    return format_date(datetime.datetime.strptime(date_key, "%Y-%m-%d"))
+
+def split_message(message: str, max_length: int = DISCORD_MAX_MESSAGE_LENGTH) -> list:
+    """Split a message into non-blank parts that don't exceed max_length, breaking after newlines where possible."""
+    parts = []
+    start = 0
+    while len(message) - start > max_length:
+        end = message.rfind('\n', start, start + max_length) + 1
+        # No usable line break in the window: cut at the limit instead
+        if end <= start or not message[start:end].strip():
+            end = start + max_length
+        part = message[start:end]
+        # Discord rejects whitespace-only messages
+        if part.strip():
+            parts.append(part)
+        start = end
+    if message[start:].strip():
+        parts.append(message[start:])
+    return parts
+
+# Cells pandas' read_csv treated as missing by default
+NA_VALUES = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+})
+
+def parse_number(value: Optional[str]) -> Optional[Union[int, float]]:
+    """Parse a tasks.csv cell as an int or float, returning None for missing or unusable cells."""
+    if value is None or value.strip() in NA_VALUES:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        logging.warning(f"Ignoring non-numeric value {value!r} in {TASKS_CSV}")
+        return None
+    if not math.isfinite(number):
+        logging.warning(f"Ignoring non-finite value {value!r} in {TASKS_CSV}")
+        return None
+    return number
+
+def load_tasks() -> Tuple[List[str], List[dict], Dict[str, dict]]:
+    """Load tasks.csv as its column names, its raw rows and a 'Task Name' -> numbers dict.
+
+    The rows keep every cell as written so a rewrite loses nothing, including
+    rows with a blank or duplicate Task Name. The dict holds the parsed RPH and
+    default_rate of the first row for each name, as the pandas lookup did.
+    """
+    try:
+        with open(TASKS_CSV, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+            fieldnames = list(reader.fieldnames or [])
+    except FileNotFoundError:
+        rows, fieldnames = [], []
+    tasks: Dict[str, dict] = {}
+    for row in rows:
+        task_name = row.get('Task Name')
+        if task_name and task_name not in tasks:
+            tasks[task_name] = {
+                'RPH': parse_number(row.get('RPH')),
+                'default_rate': parse_number(row.get('default_rate'))
+            }
+    fieldnames += [col for col in TASKS_COLUMNS if col not in fieldnames]
+    return fieldnames, rows, tasks
+
+def write_tasks(fieldnames: List[str], rows: List[dict]) -> None:
+    """Write the rows to tasks.csv with the given columns."""
+    with open(TASKS_CSV, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore', lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+
+async def refresh_tasks() -> Dict[str, dict]:
+    """Return the cached tasks dict, re-reading tasks.csv in a thread only when its mtime has changed.
+
+    Callers must hold app.state.tasks_lock.
+    """
+    global tasks_cache
+    try:
+        mtime = os.stat(TASKS_CSV).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    if tasks_cache is None or tasks_cache[0] != mtime:
+        tasks_cache = (mtime, *await asyncio.to_thread(load_tasks))
+    return tasks_cache[3]
+
+async def get_tasks() -> Dict[str, dict]:
+    """Return the tasks dict; callers must treat it as read-only."""
+    async with app.state.tasks_lock:
+        return await refresh_tasks()
+
+async def save_tasks(new_tasks: Dict[str, dict]) -> None:
+    """Append new tasks to tasks.csv, updating the cache only once the write has succeeded."""
+    global tasks_cache
+    async with app.state.tasks_lock:
+        tasks = dict(await refresh_tasks())
+        _, fieldnames, rows, _ = tasks_cache
+        rows = rows + [{**task, 'Task Name': task_name} for task_name, task in new_tasks.items()]
+        # An earlier row with the same name still wins on the next lookup
+        for task_name, task in new_tasks.items():
+            tasks.setdefault(task_name, task)
+        await asyncio.to_thread(write_tasks, fieldnames, rows)
+        tasks_cache = (os.stat(TASKS_CSV).st_mtime_ns, fieldnames, rows, tasks)
+
+def get_task_rate(tasks: Dict[str, dict], task_name: str) -> Tuple[float, bool]:
+    """Get task rate from the tasks dict, falling back to the default rate."""
+    rate = tasks.get(task_name, {}).get('default_rate')
+    return (rate, False) if rate is not None else (0.118, True)
+
+def get_task_rph(tasks: Dict[str, dict], task_name: str) -> float:
+    """Get task RPH from the tasks dict, falling back to the default RPH."""
+    rph = tasks.get(task_name, {}).get('RPH')
+    return 25 if rph is None else rph
+
+class PricedTask(NamedTuple):
+    name: str
+    info: Task
+    rate: float
+    rph: float
+    time: int
+    payout: float
+
+def price_tasks(tasks: Dict[str, dict], submitted: Dict[str, Task]) -> Tuple[List[PricedTask], Dict[float, int], Dict[str, dict]]:
+    """Price every submitted task against the tasks dict in a single pass.
+
+    Returns a PricedTask per task, the task count per rate, and placeholder
+    entries for tasks that were missing a rate. The tasks dict itself is left
+    untouched; pass the entries to save_tasks.
+    """
+    priced: List[PricedTask] = []
+    task_count_by_rate: Dict[float, int] = {}
+    new_tasks: Dict[str, dict] = {}
+    for task_name, task_info in submitted.items():
+        task_rate, is_new = get_task_rate(tasks, task_name)
+        if is_new:
+            new_tasks[task_name] = {'RPH': 25, 'default_rate': task_rate}
+        rph = get_task_rph(tasks, task_name)
+        taskCount = task_info.taskCount
+        task_count_by_rate[task_rate] = task_count_by_rate.get(task_rate, 0) + taskCount
+        priced.append(PricedTask(task_name, task_info, task_rate, rph, int(taskCount * rph), taskCount * task_rate))
+    return priced, task_count_by_rate, new_tasks
+
+async def get_dm_channel(client, user_id: int) -> str:
+    """Return the user's DM channel id, creating it on Discord only on a cache miss."""
+    channel_id = dm_channel_cache.get(user_id)
+    if channel_id is None:
+        response = await client.post(
+            DISCORD_USER_CHANNELS_PATH,
+            json={'recipient_id': str(user_id)}
+        )
+        response.raise_for_status()
+        channel_id = dm_channel_cache[user_id] = response.json()['id']
+    return channel_id
+
+def get_retry_after(response) -> float:
+    """Seconds Discord asks us to wait after a 429, from the body or the Retry-After header."""
     try:
-        df = pd.read_csv('tasks.csv')
-        required_columns = ['Task Name', 'RPH', 'default_rate']
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = None
-        return df
-    except (pd.errors.EmptyDataError, FileNotFoundError):
-        return pd.DataFrame(columns=['Task Name', 'RPH', 'default_rate'])
-
-def get_task_rate(df, task_name):
-    """Get task rate from DataFrame, handling missing columns gracefully."""
-    if task_name in df['Task Name'].values:
-        if 'default_rate' in df.columns:
-            rate_series = df.loc[df['Task Name'] == task_name, 'default_rate']
-            if not rate_series.empty:
-                rate = rate_series.values[0]
-                if pd.notna(rate):
-                    return rate, False
-    return 0.118, True
+        return float(response.json()['retry_after'])
+    except (ValueError, KeyError, TypeError):
+        return float(response.headers.get('Retry-After', 1))
+
+async def post_message(client, channel_id, content):
+    """Post a message to a Discord channel, waiting out and retrying rate-limited (429) attempts."""
+    async with app.state.discord_sem:
+        for attempt in range(DISCORD_RATE_LIMIT_RETRIES + 1):
+            response = await client.post(
+                DISCORD_CHANNEL_MESSAGES_PATH.format(channel_id=channel_id),
+                json={'content': content}
+            )
+            if response.status_code != 429 or attempt == DISCORD_RATE_LIMIT_RETRIES:
+                return response
+            await asyncio.sleep(get_retry_after(response))
+
+async def post_messages(client, channel_id, contents, ordered=False):
+    """Post messages to a Discord channel, concurrently unless their order matters."""
+    if ordered:
+        for content in contents:
+            response = await post_message(client, channel_id, content)
+            response.raise_for_status()
+        return
+    responses = await asyncio.gather(
+        *(post_message(client, channel_id, content) for content in contents),
+        return_exceptions=True
+    )
+    for response in responses:
+        if isinstance(response, Exception):
+            raise response
+        response.raise_for_status()
+
+async def send_dm(client, user_id: int, contents, ordered=False):
+    """Send messages to the user's DM channel, refreshing a stale cached channel once."""
+    cached = user_id in dm_channel_cache
+    channel_id = await get_dm_channel(client, user_id)
+    try:
+        await post_messages(client, channel_id, contents, ordered)
+    except httpx.HTTPStatusError as e:
+        if not cached or e.response.status_code != 404:
+            raise
+        dm_channel_cache.pop(user_id, None)
+        channel_id = await get_dm_channel(client, user_id)
+        await post_messages(client, channel_id, contents, ordered)
 
 # WebSocket Handlers
 async def handle_status(payload: dict) -> dict:
     try:
-        data = StatusPayload(**payload)
-        if not is_user_authorized(data.user_id):
+        data = StatusPayload.model_validate(payload)
+        if data.user_id != AUTHORIZED_USER_ID:
             return {'status': 'error', 'error': 'User not authorized', 'code': 403}
         return {'status': 'success', 'data': {'status': 'Online'}, 'code': 200}
     except ValidationError as e:
@@ -122,8 +355,8 @@ async def handle_status(payload: dict) -> dict:
 
 async def handle_login(payload: dict) -> dict:
     try:
-        data = StatusPayload(**payload)
-        if is_user_authorized(data.user_id):
+        data = StatusPayload.model_validate(payload)
+        if data.user_id == AUTHORIZED_USER_ID:
             return {'status': 'success', 'data': {'message': 'Login successful'}, 'code': 200}
         else:
             return {'status': 'error', 'error': 'User not allowed', 'code': 403}
@@ -132,31 +365,22 @@ async def handle_login(payload: dict) -> dict:
 
 async def handle_send_signal(payload: dict) -> dict:
     try:
-        data = SignalPayload(**payload)
+        if is_unauthorized_payload(payload):
+            return {'status': 'error', 'error': 'User not authorized', 'code': 403}
+        
+        data = SignalPayload.model_validate(payload)
         
-        if not is_user_authorized(data.user_id):
+        if data.user_id != AUTHORIZED_USER_ID:
             return {'status': 'error', 'error': 'User not authorized', 'code': 403}
         
         try:
-            async with httpx.AsyncClient() as client:
-                create_dm_response = await client.post(
-                    f'{DISCORD_API_BASE}/users/@me/channels',
-                    json={'recipient_id': str(data.user_id)},
-                    headers={'Authorization': f'Bot {os.environ["DISCORD_BOT_TOKEN"]}'}
-                )
-                create_dm_response.raise_for_status()
-                dm_channel = create_dm_response.json()
-                
-                for message in data.messages:
-                    for _ in range(message.count):
-                        response = await client.post(
-                            f'{DISCORD_API_BASE}/channels/{dm_channel["id"]}/messages',
-                            json={'content': message.text},
-                            headers={'Authorization': f'Bot {os.environ["DISCORD_BOT_TOKEN"]}'}
-                        )
-                        response.raise_for_status()
-                
-                return {'status': 'success', 'data': {'message': 'Signal sent to the Discord user successfully'}, 'code': 200}
+            await send_dm(
+                app.state.http,
+                data.user_id,
+                [message.text for message in data.messages for _ in range(message.count)]
+            )
+            
+            return {'status': 'success', 'data': {'message': 'Signal sent to the Discord user successfully'}, 'code': 200}
         except httpx.HTTPStatusError as e:
             logging.error(f"HTTP error sending signal to Discord: {str(e)}", exc_info=True)
             return {'status': 'error', 'error': f'Error sending signal to Discord: {str(e)}', 'code': e.response.status_code}
@@ -169,93 +393,65 @@ async def handle_send_signal(payload: dict) -> dict:
 
 async def handle_process_tasks(payload: dict) -> dict:
     try:
-        data = TaskPayload(**payload)
+        if is_unauthorized_payload(payload):
+            return {'status': 'error', 'error': 'User not authorized', 'code': 403}
+        
+        data = TaskPayload.model_validate(payload)
         
         if not data.user_id:
             return {'status': 'error', 'error': 'User ID is required', 'code': 400}
         
-        if not is_user_authorized(data.user_id):
+        if data.user_id != AUTHORIZED_USER_ID:
             return {'status': 'error', 'error': 'User not authorized', 'code': 403}
         
-        df = load_or_create_tasks_df()
-        total_task_count = 0
-        total_time = 0
-        total_payout = 0
-        task_count_by_rate = {}
-        new_tasks = []
-        response_msg = ''
-        all_dates = []
+        tasks = await get_tasks()
+        priced, task_count_by_rate, new_tasks = price_tasks(tasks, data.tasks)
+        total_task_count = sum(task_count_by_rate.values())
+        total_time = sum(task.time for task in priced)
+        total_payout = sum(task.payout for task in priced)
+        parts = []
+        all_date_keys = []
         
-        for task_name, task_info in data.tasks.items():
-            task_dates = [datetime.datetime.strptime(d, "%Y-%m-%d") for d in task_info.dates.keys()]
-            all_dates.extend(task_dates)
-            taskCount = task_info.taskCount
-            total_task_count += taskCount
-            task_rate, is_new = get_task_rate(df, task_name)
-            
-            if is_new:
-                new_tasks.append(task_name)
-                new_row = pd.DataFrame({'Task Name': [task_name], 'RPH': [25], 'default_rate': [task_rate]})
-                df = pd.concat([df, new_row], ignore_index=True)
-            
-            if task_name in df['Task Name'].values:
-                rph_series = df.loc[df['Task Name'] == task_name, 'RPH']
-                rph = rph_series.values[0] if not rph_series.empty and pd.notna(rph_series.values[0]) else 25
-            else:
-                rph = 25
-            
-            task_count_by_rate[task_rate] = task_count_by_rate.get(task_rate, 0) + taskCount
-            task_time = int(taskCount * rph)
-            total_time += task_time
-            task_payout = taskCount * task_rate
-            total_payout += task_payout
+        for task in priced:
+            task_date_keys = list(task.info.dates.keys())
+            all_date_keys.extend(task_date_keys)
             
-            response_msg += (
-                f'🔧 Task: **{task_name}**, Dates: {", ".join([d.strftime("%d %b %Y") for d in task_dates])}, '
-                f'Tasks completed: {taskCount}, Fixed RPH: {rph:.2f} seconds, '
-                f'Task rate: ${task_rate:.3f},\n'
-                f'⏰ Total time for this task: {format_seconds(task_time)},\n'
-                f'💰 Estimated Payout: ${task_payout:.2f}.\n\n'
-            )
+            parts.append(TASK_REPORT_TEMPLATE.format(
+                name=task.name,
+                dates=', '.join([format_date_key(d) for d in task_date_keys]),
+                count=task.info.taskCount,
+                rph=task.rph,
+                rate=task.rate,
+                time=format_seconds(task.time),
+                payout=task.payout
+            ))
         
-        if all_dates:
-            response_msg = (
-                f"🗓️ Report Date Range: {min(all_dates).strftime('%d %b %Y')} - {max(all_dates).strftime('%d %b %Y')}\n\n"
-                + response_msg
+        if all_date_keys:
+            # YYYY-MM-DD keys sort lexically in date order, so min/max give the range bounds
+            parts.insert(
+                0, f"🗓️ Report Date Range: {format_date_key(min(all_date_keys))} - {format_date_key(max(all_date_keys))}\n\n"
             )
             for rate, count in task_count_by_rate.items():
-                response_msg += f'📝 Total tasks completed at ${rate:.3f}: **{count}**\n'
-            response_msg += f"📝 Total tasks completed: **{total_task_count}**\n"
-            response_msg += f"⏱️ Total time spent: **{format_seconds(total_time)}**.\n"
-            response_msg += f"💰 Estimated total payout: **${total_payout:.2f}**.\n"
+                parts.append(RATE_TOTAL_TEMPLATE.format(rate=rate, count=count))
+            parts.append(REPORT_TOTALS_TEMPLATE.format(
+                count=total_task_count,
+                time=format_seconds(total_time),
+                payout=total_payout
+            ))
         
         if new_tasks:
-            df.to_csv('tasks.csv', index=False)
-            response_msg += (
+            await save_tasks(new_tasks)
+            parts.append(
                 "🆕 New tasks detected. Please update the time per task and task rate in 'tasks.csv': "
                 + ', '.join(f"**{task_name}**" for task_name in new_tasks)
             )
-            response_msg += "\n✅ A placeholder time per task of 25 seconds and task rate of $0.118 has been added.\n"
+            parts.append("\n✅ A placeholder time per task of 25 seconds and task rate of $0.118 has been added.\n")
         
-        response_parts = [response_msg[i:i+2000] for i in range(0, len(response_msg), 2000)]
+        response_msg = ''.join(parts)
+        response_parts = split_message(response_msg)
         
         try:
-            async with httpx.AsyncClient() as client:
-                create_dm_response = await client.post(
-                    f'{DISCORD_API_BASE}/users/@me/channels',
-                    json={'recipient_id': str(data.user_id)},
-                    headers={'Authorization': f'Bot {os.environ["DISCORD_BOT_TOKEN"]}'}
-                )
-                create_dm_response.raise_for_status()
-                dm_channel = create_dm_response.json()
-                
-                for part in response_parts:
-                    response = await client.post(
-                        f'{DISCORD_API_BASE}/channels/{dm_channel["id"]}/messages',
-                        json={'content': part},
-                        headers={'Authorization': f'Bot {os.environ["DISCORD_BOT_TOKEN"]}'}
-                    )
-                    response.raise_for_status()
+            await send_dm(app.state.http, data.user_id, response_parts, ordered=True)
             
             return {
                 'status': 'success',
@@ -277,43 +473,24 @@ async def handle_process_tasks(payload: dict) -> dict:
 
 async def handle_get_task_stats(payload: dict) -> dict:
     try:
-        data = TaskPayload(**payload)
+        if is_unauthorized_payload(payload):
+            return {'status': 'error', 'error': 'User not authorized', 'code': 403}
+        
+        data = TaskPayload.model_validate(payload)
         
         if not data.user_id:
             return {'status': 'error', 'error': 'User ID is required', 'code': 400}
         
-        if not is_user_authorized(data.user_id):
+        if data.user_id != AUTHORIZED_USER_ID:
             return {'status': 'error', 'error': 'User not authorized', 'code': 403}
         
-        df = load_or_create_tasks_df()
-        total_task_count = 0
-        total_time = 0
-        total_payout = 0
-        new_tasks = []
-        
-        for task_name, task_info in data.tasks.items():
-            taskCount = task_info.taskCount
-            total_task_count += taskCount
-            task_rate, is_new = get_task_rate(df, task_name)
-            
-            if is_new:
-                new_tasks.append(task_name)
-                new_row = pd.DataFrame({'Task Name': [task_name], 'RPH': [25], 'default_rate': [task_rate]})
-                df = pd.concat([df, new_row], ignore_index=True)
-            
-            if task_name in df['Task Name'].values:
-                rph_series = df.loc[df['Task Name'] == task_name, 'RPH']
-                rph = rph_series.values[0] if not rph_series.empty and pd.notna(rph_series.values[0]) else 25
-            else:
-                rph = 25
-            
-            task_time = int(taskCount * rph)
-            total_time += task_time
-            task_payout = taskCount * task_rate
-            total_payout += task_payout
+        tasks = await get_tasks()
+        priced, _, new_tasks = price_tasks(tasks, data.tasks)
+        total_time = sum(task.time for task in priced)
+        total_payout = sum(task.payout for task in priced)
         
         if new_tasks:
-            df.to_csv('tasks.csv', index=False)
+            await save_tasks(new_tasks)
         
         return {
             'status': 'success',
@@ -327,6 +504,14 @@ async def handle_get_task_stats(payload: dict) -> dict:
     except ValidationError as e:
         return {'status': 'error', 'error': f'Invalid payload: {str(e)}', 'code': 400}
 
+ACTIONS = {
+    "status": handle_status,
+    "login": handle_login,
+    "send_signal": handle_send_signal,
+    "process_tasks": handle_process_tasks,
+    "get_task_stats": handle_get_task_stats,
+}
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
@@ -334,41 +519,32 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             data = await websocket.receive_text()
-            msg = json.loads(data)
+            msg = orjson.loads(data)
             action = msg.get("action")
             payload = msg.get("payload", {})
             message_id = msg.get("messageId")
             
-            response = None
-            
-            if action == "status":
-                response = await handle_status(payload)
-            elif action == "login":
-                response = await handle_login(payload)
-            elif action == "send_signal":
-                response = await handle_send_signal(payload)
-            elif action == "process_tasks":
-                response = await handle_process_tasks(payload)
-            elif action == "get_task_stats":
-                response = await handle_get_task_stats(payload)
+            handler = ACTIONS.get(action) if isinstance(action, str) else None
+            if handler is not None:
+                response = await handler(payload)
             else:
                 response = {'status': 'error', 'error': 'Unknown action', 'code': 400}
             
             if message_id is not None:
                 response['messageId'] = message_id
             
-            await websocket.send_text(json.dumps(response))
+            await websocket.send_text(orjson.dumps(response).decode())
             
     except WebSocketDisconnect:
         logging.info("WebSocket disconnected")
     except Exception as e:
         logging.error(f"WebSocket error: {str(e)}", exc_info=True)
         try:
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(orjson.dumps({
                 'status': 'error',
                 'error': f'Server error: {str(e)}',
                 'code': 500
-            }))
+            }).decode())
         except:
             pass
         await websocket.close()
@@ -376,4 +552,4 @@ async def websocket_endpoint(websocket: WebSocket):
 if __name__ == '__main__':
     import uvicorn
     print(f"Starting server with authorized user ID: {AUTHORIZED_USER_ID}")
-    uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8080, loop="uvloop", http="httptools")
\ No newline at end of file
@@ -0,0 +1,144 @@
+import asyncio
+import os
+
+import httpx
+
+os.environ.setdefault('DISCORD_BOT_TOKEN', 'test-token')
+
+import server
+from server import split_message
+
+
+def test_split_message_short_message_is_one_part():
+    assert split_message('hello\nworld') == ['hello\nworld']
+
+
+def test_split_message_empty_message_has_no_parts():
+    assert split_message('') == []
+
+
+def test_split_message_breaks_after_last_newline_in_window():
+    message = 'a' * 6 + '\n' + 'b' * 6 + '\n' + 'c' * 3
+    assert split_message(message, max_length=10) == ['a' * 6 + '\n', 'b' * 6 + '\n' + 'c' * 3]
+
+
+def test_split_message_cuts_long_lines_at_the_limit():
+    assert split_message('x' * 25, max_length=10) == ['x' * 10, 'x' * 10, 'x' * 5]
+
+
+def test_split_message_never_returns_whitespace_only_parts():
+    parts = split_message('\n' + 'x' * 2500)
+    assert parts == ['\n' + 'x' * 1999, 'x' * 501]
+    assert all(part.strip() for part in parts)
+    assert all(len(part) <= 2000 for part in parts)
+
+
+def test_split_message_drops_blank_runs():
+    parts = split_message('a\n' + ' ' * 30 + '\nb', max_length=10)
+    assert all(part.strip() for part in parts)
+    assert all(len(part) <= 10 for part in parts)
+    assert parts[0] == 'a\n'
+
+
+def test_post_message_retries_after_rate_limit():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(429, json={'retry_after': 0})
+        return httpx.Response(200, json={'id': '1'})
+
+    async def run():
+        server.app.state.discord_sem = asyncio.Semaphore(server.DISCORD_MAX_CONCURRENCY)
+        async with httpx.AsyncClient(base_url=server.DISCORD_API_BASE, transport=httpx.MockTransport(handler)) as client:
+            return await server.post_message(client, '42', 'hi')
+
+    response = asyncio.run(run())
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert calls[0].url.path.endswith('/channels/42/messages')
+
+
+def test_post_message_gives_up_after_retries():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={'Retry-After': '0'})
+
+    async def run():
+        server.app.state.discord_sem = asyncio.Semaphore(server.DISCORD_MAX_CONCURRENCY)
+        async with httpx.AsyncClient(base_url=server.DISCORD_API_BASE, transport=httpx.MockTransport(handler)) as client:
+            return await server.post_message(client, '42', 'hi')
+
+    response = asyncio.run(run())
+    assert response.status_code == 429
+    assert len(calls) == server.DISCORD_RATE_LIMIT_RETRIES + 1
+
+
+def test_is_unauthorized_payload_matches_validated_user_id():
+    authorized = server.AUTHORIZED_USER_ID
+    for user_id in (authorized, str(authorized), f' {authorized} ', float(authorized), f'{authorized}.0'):
+        assert not server.is_unauthorized_payload({'user_id': user_id})
+    assert server.is_unauthorized_payload({'user_id': authorized + 1})
+    assert server.is_unauthorized_payload({'user_id': str(authorized + 1)})
+    assert not server.is_unauthorized_payload({})
+    assert not server.is_unauthorized_payload([])
+
+
+def use_tasks_csv(monkeypatch, tmp_path, content):
+    path = tmp_path / 'tasks.csv'
+    path.write_bytes(content.encode('utf-8'))
+    monkeypatch.setattr(server, 'TASKS_CSV', str(path))
+    return path
+
+
+def test_load_tasks_strips_excel_bom(monkeypatch, tmp_path):
+    use_tasks_csv(monkeypatch, tmp_path, '\ufeffTask Name,RPH,default_rate\ntask1,30,0.2\ntask2,60,1\n')
+    fieldnames, rows, tasks = server.load_tasks()
+    assert fieldnames == ['Task Name', 'RPH', 'default_rate']
+    assert tasks == {'task1': {'RPH': 30, 'default_rate': 0.2}, 'task2': {'RPH': 60, 'default_rate': 1}}
+
+
+def test_load_tasks_treats_na_tokens_as_missing(monkeypatch, tmp_path):
+    use_tasks_csv(monkeypatch, tmp_path, 'Task Name,RPH,default_rate\na,NA,nan\nb,N/A,null\nc,inf,oops\nd,,\n')
+    _, _, tasks = server.load_tasks()
+    assert all(task == {'RPH': None, 'default_rate': None} for task in tasks.values())
+    assert server.get_task_rate(tasks, 'a') == (0.118, True)
+    assert server.get_task_rph(tasks, 'c') == 25
+
+
+def test_load_tasks_uses_first_row_for_duplicate_names(monkeypatch, tmp_path):
+    use_tasks_csv(monkeypatch, tmp_path, 'Task Name,RPH,default_rate\ntask1,30,0.2\ntask1,60,1\n')
+    _, _, tasks = server.load_tasks()
+    assert tasks == {'task1': {'RPH': 30, 'default_rate': 0.2}}
+
+
+def test_write_tasks_round_trips_every_row_and_column(monkeypatch, tmp_path):
+    content = (
+        '\ufeffNotes,Task Name,RPH,default_rate\n'
+        'first,task1,30,0.2\n'
+        'blank name,,45,0.5\n'
+        'dup,task1,60,1\n'
+        'missing,task2,NA,\n'
+    )
+    path = use_tasks_csv(monkeypatch, tmp_path, content)
+    fieldnames, rows, _ = server.load_tasks()
+    server.write_tasks(fieldnames, rows)
+    assert path.read_bytes() == content[1:].encode('utf-8')
+
+
+def test_save_tasks_appends_new_tasks(monkeypatch, tmp_path):
+    path = use_tasks_csv(monkeypatch, tmp_path, '\ufeffTask Name,RPH,default_rate,Notes\ntask1,30,0.2,keep me\n')
+    monkeypatch.setattr(server, 'tasks_cache', None)
+
+    async def run():
+        server.app.state.tasks_lock = asyncio.Lock()
+        await server.save_tasks({'task2': {'RPH': 25, 'default_rate': 0.118}})
+        return await server.get_tasks()
+
+    tasks = asyncio.run(run())
+    assert path.read_text(encoding='utf-8') == 'Task Name,RPH,default_rate,Notes\ntask1,30,0.2,keep me\ntask2,25,0.118,\n'
+    assert tasks == {'task1': {'RPH': 30, 'default_rate': 0.2}, 'task2': {'RPH': 25, 'default_rate': 0.118}}
+    assert server.load_tasks()[2] == tasks